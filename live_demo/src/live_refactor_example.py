@@ -1,4 +1,75 @@
-import re
+import string
+
+_TLD_ALLOWED = frozenset(string.ascii_letters)
+_DOMAIN_ALLOWED = frozenset(string.ascii_letters + string.digits + ".-")
+_LOCAL_ALLOWED = frozenset(string.ascii_letters + string.digits + "._%+-")
+_SPECIAL = frozenset("!@#$%^&*")
+
+
+def _is_valid_email(email):
+    """
+    Check email format as local@domain.tld with a linear scan (no regex).
+    """
+    local, at, domain = email.rpartition("@")
+    if not at or not local or not set(local) <= _LOCAL_ALLOWED:
+        return False
+    host, dot, tld = domain.rpartition(".")
+    return (
+        bool(dot and host)
+        and len(tld) >= 2
+        and set(host) <= _DOMAIN_ALLOWED
+        and set(tld) <= _TLD_ALLOWED
+    )
+
+
+def _password_classes(password):
+    """
+    Return (has_upper, has_lower, has_digit, has_special) for password.
+    """
+    has_upper = False
+    has_lower = False
+    has_digit = False
+    has_special = not _SPECIAL.isdisjoint(password)
+    for char in password:
+        if char.isupper():
+            has_upper = True
+        elif char.islower():
+            has_lower = True
+        elif char.isdigit():
+            has_digit = True
+        if has_upper and has_lower and has_digit:
+            break
+    return has_upper, has_lower, has_digit, has_special
+
+
+def _has_valid_name_chars(name):
+    """
+    Check that name holds only letters and spaces, with at least one letter.
+    """
+    has_alpha = False
+    for char in name:
+        if char.isalpha():
+            has_alpha = True
+        elif char != " ":
+            return False
+    return has_alpha
+
+
+def is_valid_registration(email, password, name):
+    """
+    Check user registration data, stopping at the first failed rule.
+    """
+    return (
+        bool(email)
+        and 5 <= len(email) <= 254
+        and _is_valid_email(email)
+        and bool(password)
+        and 8 <= len(password) <= 128
+        and all(_password_classes(password))
+        and bool(name)
+        and 2 <= len(name) <= 50
+        and _has_valid_name_chars(name)
+    )
 
 
 def validate_user_registration(email, password, name):
@@ -16,9 +87,7 @@ def validate_user_registration(email, password, name):
             errors.append("Email too long")
         if "@" not in email:
             errors.append("Email must contain @")
-        if not re.match(
-            r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$", email
-        ):
+        elif 5 <= len(email) <= 254 and not _is_valid_email(email):
             errors.append("Email format invalid")
 
     if not password:
@@ -28,19 +97,9 @@ def validate_user_registration(email, password, name):
             errors.append("Password too short")
         if len(password) > 128:
             errors.append("Password too long")
-        has_upper = False
-        has_lower = False
-        has_digit = False
-        has_special = False
-        for char in password:
-            if char.isupper():
-                has_upper = True
-            if char.islower():
-                has_lower = True
-            if char.isdigit():
-                has_digit = True
-            if char in "!@#$%^&*":
-                has_special = True
+        has_upper, has_lower, has_digit, has_special = _password_classes(
+            password
+        )
         if not has_upper:
             errors.append("Password needs uppercase")
         if not has_lower:
@@ -57,7 +116,7 @@ def validate_user_registration(email, password, name):
             errors.append("Name too short")
         if len(name) > 50:
             errors.append("Name too long")
-        if not name.replace(" ", "").isalpha():
+        if not _has_valid_name_chars(name):
             errors.append("Name contains invalid characters")
 
     if errors:
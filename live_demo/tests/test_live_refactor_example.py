@@ -1,4 +1,5 @@
 from live_demo.src.live_refactor_example import (
+    is_valid_registration,
     validate_user_registration,
 )
 
@@ -19,6 +20,12 @@ def test_invalid_email():
     assert "Email" in str(result["errors"])
 
 
+def test_invalid_email_reports_cheapest_error():
+    """Test format check is skipped once a simpler email check fails."""
+    result = validate_user_registration("a@b", "Password123!", "John Doe")
+    assert result["errors"] == ["Email too short"]
+
+
 def test_weak_password():
     """Test weak password."""
     result = validate_user_registration("john@example.com", "weak", "John Doe")
@@ -31,3 +38,20 @@ def test_empty_fields():
     result = validate_user_registration("", "", "")
     assert result["success"] is False
     assert len(result["errors"]) >= 3
+
+
+def test_invalid_email_domain():
+    """Test email with a malformed domain."""
+    result = validate_user_registration(
+        "john@example.c", "Password123!", "John"
+    )
+    assert result["success"] is False
+    assert "Email format invalid" in result["errors"]
+
+
+def test_is_valid_registration():
+    """Test boolean registration check."""
+    assert is_valid_registration("john@example.com", "Password123!", "John Doe")
+    assert not is_valid_registration("bad-email", "Password123!", "John Doe")
+    assert not is_valid_registration("john@example.com", "weak", "John Doe")
+    assert not is_valid_registration("john@example.com", "Password123!", "")
@@ -4,105 +4,285 @@ This module validates passwords based on security rules.
 """
 
 import re
-
-
-def validate_password(password, options=None):
+from functools import lru_cache
+
+_REPEAT_RE = re.compile(r"(.)\1\1")
+_SEQ_DIGIT_RE = re.compile(r"(012|123|234|345|456|567|678|789|890)")
+_SEQ_LETTER_RE = re.compile(
+    r"(abc|bcd|cde|def|efg|fgh|ghi|hij|ijk|jkl|klm|lmn|mno|nop|opq|pqr|qrs|rst"
+    r"|stu|tuv|uvw|vwx|wxy|xyz)"
+)
+_SPECIAL = frozenset("!@#$%^&*()_+-=[]{}|;:,.<>?")
+_DEFAULT_FORBIDDEN_WORDS = ("password", "123456", "qwerty")
+_KEYBOARD_ROWS = ("qwertyuiop", "asdfghjkl", "zxcvbnm", "1234567890")
+_KEYBOARD_TRIGRAMS = tuple(
+    row[i : i + 3] for row in _KEYBOARD_ROWS for i in range(len(row) - 2)
+)
+_KEYBOARD_WARNINGS = tuple(
+    (("keyboard", trigram), f"Password contains keyboard pattern '{trigram}'")
+    for trigram in _KEYBOARD_TRIGRAMS
+)
+_KEYBOARD_TAGS = frozenset(tag for tag, _ in _KEYBOARD_WARNINGS)
+# Below this length the JIT dispatch costs more than the loop it replaces.
+_JIT_MIN_LENGTH = 64
+
+def _classify_bytes(buf, special):
+    """Classify ASCII bytes into (upper, lower, digit, special, length)."""
+    has_upper = has_lower = has_digit = has_special = False
+    for b in buf:
+        # Setting bit 0x20 folds A-Z onto a-z, so one range check
+        # covers both cases and the original byte tells them apart.
+        lc = b | 0x20
+        is_alpha = (lc >= 97) & (lc <= 122)
+        has_upper |= is_alpha & (b < 97)
+        has_lower |= is_alpha & (b >= 97)
+        has_digit |= (b >= 48) & (b <= 57)
+        has_special |= special[b] != 0
+    return has_upper, has_lower, has_digit, has_special, len(buf)
+
+
+@lru_cache(maxsize=None)
+def _get_jit():
     """
-    Validate a password based on security rules.
+    Compile the ASCII classifier with numba on first use.
 
-    Args:
-        password: The password to validate
-        options: Optional configuration (min_length, require_special, etc.)
+    numpy and numba are imported here rather than at module load, since
+    only passwords longer than _JIT_MIN_LENGTH need them.
 
     Returns:
-        dict: Validation result with success status and messages
+        A function mapping an ASCII password to its four class flags, or
+        None when numba is not installed.
     """
-    if not password:
-        return {
-            "valid": False,
-            "message": "Password is required",
-            "errors": ["Password cannot be empty"],
-        }
+    try:
+        import numpy as np
+        from numba import njit
+    except ImportError:  # numba is optional; fall back to the pure-Python loop
+        return None
+
+    classify_bytes = njit(cache=True)(_classify_bytes)
+    special_bitmap = np.zeros(256, dtype=np.uint8)
+    special_bitmap[[ord(c) for c in _SPECIAL]] = 1
+
+    def classify_ascii(password):
+        buf = np.frombuffer(password.encode("ascii"), dtype=np.uint8)
+        return classify_bytes(buf, special_bitmap)[:4]
+
+    return classify_ascii
+
+
+def _classify(password):
+    """Return (has_upper, has_lower, has_digit, has_special) for password."""
+    if len(password) > _JIT_MIN_LENGTH and password.isascii():
+        classify_ascii = _get_jit()
+        if classify_ascii is not None:
+            return classify_ascii(password)
+
+    has_upper = has_lower = has_digit = False
+    for c in password:
+        if c.isupper():
+            has_upper = True
+        elif c.islower():
+            has_lower = True
+        elif c.isdigit():
+            has_digit = True
+    return has_upper, has_lower, has_digit, not _SPECIAL.isdisjoint(password)
+
+
+def _build_trie(patterns):
+    """Insert (pattern, tag) pairs into a trie of goto dicts and outputs."""
+    goto = [{}]
+    outputs = [set()]
+    for pattern, tag in patterns:
+        state = 0
+        for char in pattern:
+            if char not in goto[state]:
+                goto.append({})
+                outputs.append(set())
+                goto[state][char] = len(goto) - 1
+            state = goto[state][char]
+        outputs[state].add(tag)
+    return goto, outputs
+
+
+def _link_failures(goto, outputs):
+    """Compute failure links breadth-first, merging inherited outputs."""
+    fail = [0] * len(goto)
+    queue = list(goto[0].values())
+    for state in queue:
+        outputs[state] |= outputs[0]
+    for state in queue:
+        for char, child in goto[state].items():
+            fallback = fail[state]
+            while fallback and char not in goto[fallback]:
+                fallback = fail[fallback]
+            fail[child] = goto[fallback].get(char, 0)
+            outputs[child] |= outputs[fail[child]]
+            queue.append(child)
+    return fail
+
+
+@lru_cache(maxsize=32)
+def _build_pattern_automaton(forbidden_words):
+    """
+    Build an Aho-Corasick automaton over forbidden words and keyboard trigrams.
 
-    # Default options
+    Each pattern is tagged with ("forbidden", word) or ("keyboard", trigram)
+    so a single scan of the password reports every source that matched.
+    """
+    patterns = [(word.lower(), ("forbidden", word)) for word in forbidden_words]
+    patterns += [
+        (trigram, ("keyboard", trigram)) for trigram in _KEYBOARD_TRIGRAMS
+    ]
+    goto, outputs = _build_trie(patterns)
+    fail = _link_failures(goto, outputs)
+    return goto, fail, outputs
+
+
+def _scan_patterns(text, automaton):
+    """Return the tags of every pattern found in text in one linear pass."""
+    goto, fail, outputs = automaton
+    found = set(outputs[0])
+    state = 0
+    for char in text:
+        while state and char not in goto[state]:
+            state = fail[state]
+        state = goto[state].get(char, 0)
+        found |= outputs[state]
+    return found
+
+
+def _freeze_options(options):
+    """
+    Reduce options to a hashable key holding only the values the validator
+    reads, in a fixed order with defaults filled in.
+    """
     if options is None:
         options = {}
+    return (
+        options.get("min_length", 8),
+        options.get("max_length", 128),
+        bool(options.get("require_uppercase", True)),
+        bool(options.get("require_lowercase", True)),
+        bool(options.get("require_digits", True)),
+        bool(options.get("require_special", True)),
+        tuple(options.get("forbidden_words", _DEFAULT_FORBIDDEN_WORDS)),
+    )
+
+
+def _cached(func, key):
+    """Call an lru_cache'd func, bypassing the cache if key is unhashable."""
+    try:
+        hash(key)
+    except TypeError:
+        return func.__wrapped__(key)
+    return func(key)
+
+
+@lru_cache(maxsize=128)
+def _resolve_options(frozen_options):
+    """
+    Resolve frozen options into the rules shared by every validator.
 
-    min_length = options.get("min_length", 8)
-    max_length = options.get("max_length", 128)
-    require_uppercase = options.get("require_uppercase", True)
-    require_lowercase = options.get("require_lowercase", True)
-    require_digits = options.get("require_digits", True)
-    require_special = options.get("require_special", True)
-    forbidden_words = options.get(
-        "forbidden_words", ["password", "123456", "qwerty"]
+    Returns (min_length, max_length, class_checks, forbidden_words), where
+    class_checks only lists the enabled (index, message) requirements.
+    """
+    (
+        min_length,
+        max_length,
+        require_uppercase,
+        require_lowercase,
+        require_digits,
+        require_special,
+        forbidden_words,
+    ) = frozen_options
+
+    # (enabled, index into the _classify result, error message)
+    class_requirements = [
+        (
+            require_uppercase,
+            0,
+            "Password must contain at least one uppercase letter",
+        ),
+        (
+            require_lowercase,
+            1,
+            "Password must contain at least one lowercase letter",
+        ),
+        (
+            require_digits,
+            2,
+            "Password must contain at least one digit",
+        ),
+        (
+            require_special,
+            3,
+            "Password must contain at least one special character",
+        ),
+    ]
+    class_checks = tuple(
+        (index, message)
+        for enabled, index, message in class_requirements
+        if enabled
     )
+    return min_length, max_length, class_checks, forbidden_words
 
-    errors = []
-    warnings = []
 
-    if len(password) < min_length:
-        errors.append(f"Password must be at least {min_length} characters long")
-    elif len(password) > max_length:
-        errors.append(
+def _length_errors(length, min_length, max_length):
+    """Return the error for a length outside [min_length, max_length]."""
+    if length < min_length:
+        return [f"Password must be at least {min_length} characters long"]
+    if length > max_length:
+        return [
             f"Password must be no more than {max_length} characters long"
-        )
+        ]
+    return []
+
 
-    if require_uppercase:
-        if not any(c.isupper() for c in password):
-            errors.append("Password must contain at least one uppercase letter")
+def _class_errors(classes, class_checks):
+    """Return the messages of the enabled class checks that classes fail."""
+    return [message for index, message in class_checks if not classes[index]]
 
-    if require_lowercase:
-        if not any(c.islower() for c in password):
-            errors.append("Password must contain at least one lowercase letter")
 
-    if require_digits:
-        if not any(c.isdigit() for c in password):
-            errors.append("Password must contain at least one digit")
+def _forbidden_word_errors(matches, forbidden_errors):
+    """Return the error for each forbidden word tag found in matches."""
+    return [error for tag, error in forbidden_errors if tag in matches]
 
-    if require_special:
-        special_chars = "!@#$%^&*()_+-=[]{}|;:,.<>?"
-        if not any(c in special_chars for c in password):
-            errors.append(
-                "Password must contain at least one special character"
-            )
 
-    password_lower = password.lower()
-    for word in forbidden_words:
-        if word.lower() in password_lower:
-            errors.append(f"Password cannot contain '{word}'")
+def _pattern_warnings(password, password_lower, matches):
+    """Return warnings for weak patterns, in the order they are reported."""
+    warnings = []
 
-    if re.search(r"(.)\1{2,}", password):
+    if _REPEAT_RE.search(password):
         warnings.append("Password contains repeated characters")
 
-    if re.search(r"(012|123|234|345|456|567|678|789|890)", password):
+    if _SEQ_DIGIT_RE.search(password):
         warnings.append("Password contains sequential numbers")
 
-    if re.search(
-        r"(abc|bcd|cde|def|efg|fgh|ghi|hij|ijk|jkl|klm|lmn|mno|nop|opq|pqr|qrs|rst|stu|tuv|uvw|vwx|wxy|xyz)",
-        password.lower(),
-    ):
+    if _SEQ_LETTER_RE.search(password_lower):
         warnings.append("Password contains sequential letters")
 
-    strength_score = 0
-
-    if len(password) >= 8:
-        strength_score += 2  # Base security requirement
-    if len(password) >= 12:
-        strength_score += 1  # Good length
-    if len(password) >= 16:
-        strength_score += 1  # Very good length
     if len(password) >= 20:
-        strength_score += 1  # Excellent length
+        warnings.append(
+            "Very long password - consider using a password manager"
+        )
+
+    if not _KEYBOARD_TAGS.isdisjoint(matches):
+        for tag, warning in _KEYBOARD_WARNINGS:
+            if tag in matches:
+                warnings.append(warning)
+
+    return warnings
 
-    if any(c.isupper() for c in password):
-        strength_score += 1
-    if any(c.islower() for c in password):
-        strength_score += 1
-    if any(c.isdigit() for c in password):
-        strength_score += 1
-    if any(c in "!@#$%^&*()_+-=[]{}|;:,.<>?" for c in password):
-        strength_score += 1
+
+def _strength(length, classes):
+    """Return (strength_score, strength) for a password's length and classes."""
+    strength_score = (
+        (2 if length >= 8 else 0)  # Base security requirement
+        + (length >= 12)  # Good length
+        + (length >= 16)  # Very good length
+        + (length >= 20)  # Excellent length
+        + sum(classes)
+    )
 
     if strength_score <= 4:
         strength = "Weak"
@@ -112,39 +292,147 @@ def validate_password(password, options=None):
         strength = "Strong"
     else:
         strength = "Very Strong"
+    return strength_score, strength
 
-    if len(password) >= 20:
-        warnings.append(
-            "Very long password - consider using a password manager"
+
+def _result_message(errors, warnings, strength):
+    """Summarise a validation result in one sentence."""
+    if errors:
+        return f"Password is invalid with {len(errors)} error(s)"
+    if warnings:
+        return f"Password is valid but {strength.lower()} with {len(warnings)} warning(s)"
+    return f"Password is valid and {strength.lower()}"
+
+
+@lru_cache(maxsize=128)
+def _compile_validator(frozen_options):
+    """
+    Build a validator with the given options resolved ahead of time.
+
+    Option lookups happen once here and disabled character-class checks are
+    left out of the returned closure entirely.
+    """
+    min_length, max_length, class_checks, forbidden_words = _cached(
+        _resolve_options, frozen_options
+    )
+    automaton = _build_pattern_automaton(forbidden_words)
+    forbidden_errors = [
+        (("forbidden", word), f"Password cannot contain '{word}'")
+        for word in forbidden_words
+    ]
+
+    def validator(password):
+        if not password:
+            return {
+                "valid": False,
+                "message": "Password is required",
+                "errors": ["Password cannot be empty"],
+            }
+
+        length = len(password)
+        classes = _classify(password)
+        password_lower = password.lower()
+        matches = _scan_patterns(password_lower, automaton)
+
+        errors = (
+            _length_errors(length, min_length, max_length)
+            + _class_errors(classes, class_checks)
+            + _forbidden_word_errors(matches, forbidden_errors)
         )
+        warnings = _pattern_warnings(password, password_lower, matches)
+        strength_score, strength = _strength(length, classes)
 
-    keyboard_rows = ["qwertyuiop", "asdfghjkl", "zxcvbnm", "1234567890"]
-    for row in keyboard_rows:
-        for i in range(len(row) - 2):
-            pattern = row[i : i + 3]
-            if pattern in password.lower():
-                warnings.append(
-                    f"Password contains keyboard pattern '{pattern}'"
-                )
-
-    is_valid = len(errors) == 0
-
-    if is_valid:
-        if len(warnings) == 0:
-            message = f"Password is valid and {strength.lower()}"
-        else:
-            message = f"Password is valid but {strength.lower()} with {len(warnings)} warning(s)"
-    else:
-        message = f"Password is invalid with {len(errors)} error(s)"
-
-    return {
-        "valid": is_valid,
-        "message": message,
-        "errors": errors,
-        "warnings": warnings,
-        "strength": strength,
-        "strength_score": strength_score,
-    }
+        return {
+            "valid": not errors,
+            "message": _result_message(errors, warnings, strength),
+            "errors": errors,
+            "warnings": warnings,
+            "strength": strength,
+            "strength_score": strength_score,
+        }
+
+    return validator
+
+
+def make_password_validator(options=None, cache_size=0):
+    """
+    Create a password validator specialised for a fixed set of options.
+
+    Useful when the same options are applied to many passwords: the options
+    are resolved once instead of on every call. Validators are cached per
+    distinct options.
+
+    Args:
+        options: Optional configuration, as accepted by validate_password
+        cache_size: If positive, remember results for up to this many recent
+            passwords. Off by default because cached passwords stay in
+            memory; call the validator's cache_clear() to drop them.
+
+    Returns:
+        callable: Function taking a password and returning the same result
+        dict as validate_password
+    """
+    validator = _cached(_compile_validator, _freeze_options(options))
+    if cache_size <= 0:
+        return validator
+
+    cached_validator = lru_cache(maxsize=cache_size)(validator)
+
+    def caching_validator(password):
+        result = cached_validator(password)
+        return {
+            key: list(value) if isinstance(value, list) else value
+            for key, value in result.items()
+        }
+
+    caching_validator.cache_clear = cached_validator.cache_clear
+    return caching_validator
+
+
+def is_valid_password(password, options=None):
+    """
+    Check whether a password satisfies every rule, without a detailed report.
+
+    Stops at the first failing rule and skips warnings and strength scoring.
+
+    Args:
+        password: The password to check
+        options: Optional configuration, as accepted by validate_password
+
+    Returns:
+        bool: True if validate_password would report the password as valid
+    """
+    if not password:
+        return False
+
+    min_length, max_length, class_checks, forbidden_words = _cached(
+        _resolve_options, _freeze_options(options)
+    )
+    if not min_length <= len(password) <= max_length:
+        return False
+
+    classes = _classify(password)
+    if not all(classes[index] for index, _ in class_checks):
+        return False
+
+    matches = _scan_patterns(
+        password.lower(), _build_pattern_automaton(forbidden_words)
+    )
+    return not any(kind == "forbidden" for kind, _ in matches)
+
+
+def validate_password(password, options=None):
+    """
+    Validate a password based on security rules.
+
+    Args:
+        password: The password to validate
+        options: Optional configuration (min_length, require_special, etc.)
+
+    Returns:
+        dict: Validation result with success status and messages
+    """
+    return make_password_validator(options)(password)
 
 
 if __name__ == "__main__":
@@ -2,8 +2,14 @@
 Unit tests for password validator modules
 """
 
+import importlib.util
 import unittest
-from password_validator.src.password_validator import validate_password
+from password_validator.src.password_validator import (
+    _get_jit,
+    is_valid_password,
+    make_password_validator,
+    validate_password,
+)
 
 
 class TestPasswordValidator(unittest.TestCase):
@@ -118,6 +124,40 @@ class TestPasswordValidator(unittest.TestCase):
         self.assertEqual(strong_result["strength"], "Strong")
         self.assertEqual(very_strong_result["strength"], "Very Strong")
 
+    def test_make_password_validator(self):
+        """Test specialised validator matches validate_password"""
+        options = {"require_special": False, "forbidden_words": ["admin"]}
+        validator = make_password_validator(options)
+
+        self.assertIs(validator, make_password_validator(dict(options)))
+        for password in ["Admin123", "MySecure123", "short"]:
+            self.assertEqual(
+                validator(password), validate_password(password, options)
+            )
+
+    def test_caching_validator_returns_independent_results(self):
+        """Test opt-in result cache hands out copies and can be cleared"""
+        validator = make_password_validator(cache_size=16)
+        first = validator("weak")
+        first["errors"].clear()
+        first["valid"] = True
+
+        second = validator("weak")
+        self.assertFalse(second["valid"])
+        self.assertEqual(second, validate_password("weak"))
+        validator.cache_clear()
+
+    def test_is_valid_password(self):
+        """Test boolean check agrees with validate_password"""
+        options = {"require_special": False, "forbidden_words": ["ADMIN"]}
+        for password in ["", "MySecure123!", "weak", "MyPassword123!"]:
+            self.assertEqual(
+                is_valid_password(password),
+                validate_password(password)["valid"],
+            )
+        self.assertFalse(is_valid_password("MyAdmin123", options))
+        self.assertTrue(is_valid_password("MySecure123", options))
+
 
 class TestPasswordValidatorEdgeCases(unittest.TestCase):
     """Test edge cases and error conditions"""
@@ -131,6 +171,49 @@ class TestPasswordValidatorEdgeCases(unittest.TestCase):
             any("no more than" in error for error in result["errors"])
         )
 
+    def test_long_ascii_password(self):
+        """Test character classes are detected in long ASCII passwords"""
+        options = {"max_length": 200}
+        valid_result = validate_password("Ab1!" * 20, options)
+        no_special_result = validate_password("Ab1c" * 20, options)
+
+        self.assertTrue(valid_result["valid"])
+        self.assertEqual(valid_result["strength"], "Very Strong")
+        self.assertFalse(no_special_result["valid"])
+        self.assertTrue(
+            any(
+                "special character" in error
+                for error in no_special_result["errors"]
+            )
+        )
+
+    @unittest.skipUnless(
+        importlib.util.find_spec("numba"), "numba is not installed"
+    )
+    def test_jit_classifier(self):
+        """Test the numba classifier flags each character class"""
+        classify_ascii = _get_jit()
+        self.assertIsNotNone(classify_ascii)
+        cases = {
+            "Ab1!" * 20: (True, True, True, True),
+            "AB1!" * 20: (True, False, True, True),
+            "ab1!" * 20: (False, True, True, True),
+            "Abc!" * 20: (True, True, False, True),
+            "Ab1c" * 20: (True, True, True, False),
+            "Zz@[`{" * 15: (True, True, False, True),
+        }
+        for password, expected in cases.items():
+            with self.subTest(password=password[:8]):
+                self.assertEqual(tuple(classify_ascii(password)), expected)
+
+    def test_long_repeated_password(self):
+        """Test pattern detection stays linear on long repeated input"""
+        result = validate_password("a" * 20000)
+        self.assertFalse(result["valid"])
+        self.assertIn(
+            "Password contains repeated characters", result["warnings"]
+        )
+
     def test_password_with_spaces(self):
         """Test password with spaces"""
         result = validate_password("My Secure 123!")
@@ -154,6 +237,16 @@ class TestPasswordValidatorEdgeCases(unittest.TestCase):
         result = validate_password("a", options)
         self.assertTrue(result["valid"])
 
+    def test_unhashable_option_values(self):
+        """Test options holding dicts are accepted as before"""
+        result = validate_password("MySecure123!", {"extra": {"a": 1}})
+        self.assertTrue(result["valid"])
+
+        options = {"forbidden_words": {"admin": True}}
+        result = validate_password("MyAdmin123!", options)
+        self.assertIn("Password cannot contain 'admin'", result["errors"])
+        self.assertFalse(is_valid_password("MyAdmin123!", options))
+
     def test_empty_forbidden_words(self):
         """Test with empty forbidden words list"""
         options = {"forbidden_words": []}
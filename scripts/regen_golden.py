@@ -0,0 +1,26 @@
+"""
+Regenerate the golden analyzer output used by the text analyzer tests.
+
+Run from the repository root after an intentional change to analyze_text:
+
+    python -m scripts.regen_golden
+"""
+
+import json
+
+from text_analyzer.src.text_analyzer import analyze_text
+from text_analyzer.tests.golden import SIMPLE_GOLDEN_PATH, SIMPLE_TEXT
+
+
+def main():
+    result = analyze_text(SIMPLE_TEXT)
+    SIMPLE_GOLDEN_PATH.parent.mkdir(parents=True, exist_ok=True)
+    SIMPLE_GOLDEN_PATH.write_text(
+        json.dumps(result, indent=2, ensure_ascii=False) + "\n",
+        encoding="utf-8",
+    )
+    print(f"Wrote {SIMPLE_GOLDEN_PATH}")
+
+
+if __name__ == "__main__":
+    main()
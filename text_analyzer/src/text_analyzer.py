@@ -4,9 +4,97 @@ This module demonstrates moderate complexity suitable for refactoring.
 """
 
 import re
+import string
 from collections import Counter
 from typing import Dict
 
+_SENT_SPLIT_RE = re.compile(r"[.!?]+")
+_WORD_RE = re.compile(r"\b[a-zA-Z]+\b")
+_PUNCTUATION = ".,!?;:"
+_ENGLISH_WORDS = frozenset(
+    {"the", "and", "to", "of", "a", "in", "is", "it", "you", "that"}
+)
+_SPANISH_WORDS = frozenset(
+    {"el", "la", "de", "que", "y", "a", "en", "un", "es", "se"}
+)
+_POSITIVE_WORDS = frozenset(
+    {
+        "good",
+        "great",
+        "excellent",
+        "amazing",
+        "wonderful",
+        "fantastic",
+        "love",
+        "happy",
+    }
+)
+_NEGATIVE_WORDS = frozenset(
+    {
+        "bad",
+        "terrible",
+        "awful",
+        "hate",
+        "sad",
+        "angry",
+        "disappointed",
+        "horrible",
+    }
+)
+
+
+def _word_fold_table() -> bytes:
+    """
+    Build a bytes.translate table for _tokenize.
+
+    ASCII letters fold to lowercase, other word characters become "0" and
+    everything else becomes a space, mirroring the \b boundaries of _WORD_RE.
+    """
+    table = bytearray(b" " * 256)
+    for char in string.digits + "_":
+        table[ord(char)] = ord("0")
+    for char in string.ascii_letters:
+        table[ord(char)] = ord(char.lower())
+    return bytes(table)
+
+
+_WORD_FOLD_TABLE = _word_fold_table()
+
+
+def _tokenize(text: str) -> list:
+    """
+    Return the lowercase words of text, as _WORD_RE.findall(text.lower()).
+
+    ASCII text is folded with bytes.translate and split in C; words that
+    touch a digit or underscore keep a "0" and are dropped by isalpha().
+    """
+    if not text.isascii():
+        return _WORD_RE.findall(text.lower())
+    folded = text.encode("ascii").translate(_WORD_FOLD_TABLE).decode("ascii")
+    return [word for word in folded.split() if word.isalpha()]
+
+
+def _count_character_classes(char_counts: Counter) -> Dict:
+    """
+    Count uppercase, lowercase, digit, punctuation and whitespace characters.
+
+    Works over the distinct characters of char_counts, so each predicate
+    runs once per unique character rather than once per position.
+    """
+    return {
+        "uppercase_count": sum(
+            v for c, v in char_counts.items() if c.isupper()
+        ),
+        "lowercase_count": sum(
+            v for c, v in char_counts.items() if c.islower()
+        ),
+        "digit_count": sum(v for c, v in char_counts.items() if c.isdigit()),
+        "punctuation_count": sum(char_counts[c] for c in _PUNCTUATION),
+        "whitespace_count": sum(
+            v for c, v in char_counts.items() if c.isspace()
+        ),
+    }
+
 
 def analyze_text(text: str, options: Dict | None = None) -> Dict:
     """
@@ -33,18 +121,19 @@ def analyze_text(text: str, options: Dict | None = None) -> Dict:
     }
 
     result["basic_stats"]["total_characters"] = len(text)
-    result["basic_stats"]["total_characters_no_spaces"] = len(
-        text.replace(" ", "")
+    char_counts = Counter(text)
+    result["basic_stats"]["total_characters_no_spaces"] = (
+        len(text) - char_counts[" "]
     )
 
-    sentences = re.split(r"[.!?]+", text.strip())
+    sentences = _SENT_SPLIT_RE.split(text.strip())
     sentences = [s.strip() for s in sentences if s.strip()]
     result["basic_stats"]["total_sentences"] = len(sentences)
 
     paragraphs = [p.strip() for p in text.split("\n\n") if p.strip()]
     result["basic_stats"]["total_paragraphs"] = len(paragraphs)
 
-    words = re.findall(r"\b[a-zA-Z]+\b", text.lower())
+    words = _tokenize(text)
     result["word_analysis"]["total_words"] = len(words)
 
     if len(words) > 0:
@@ -62,39 +151,29 @@ def analyze_text(text: str, options: Dict | None = None) -> Dict:
             top_count
         )
 
-        word_lengths = [len(word) for word in words]
-        result["word_analysis"]["average_word_length"] = sum(
-            word_lengths
-        ) / len(word_lengths)
-        result["word_analysis"]["longest_word"] = max(words, key=len)
-        result["word_analysis"]["shortest_word"] = min(words, key=len)
+        # Counter keys keep first-seen order, so ties resolve as on words.
+        total_letters = sum(len(w) * c for w, c in word_counts.items())
+        result["word_analysis"]["average_word_length"] = total_letters / len(
+            words
+        )
+        result["word_analysis"]["longest_word"] = max(word_counts, key=len)
+        result["word_analysis"]["shortest_word"] = min(word_counts, key=len)
 
-        unique_words = len(set(words))
+        unique_words = len(word_counts)
         result["word_analysis"]["unique_words"] = unique_words
         result["word_analysis"]["lexical_diversity"] = unique_words / len(words)
 
-    letters = [c for c in text.lower() if c.isalpha()]
-    if letters:
-        letter_counter = Counter(letters)
+    # Fold the whole text rather than each distinct character, so that
+    # context-dependent mappings such as Greek final sigma still apply.
+    letter_counter = Counter(
+        {c: n for c, n in Counter(text.lower()).items() if c.isalpha()}
+    )
+    if letter_counter:
         result["character_analysis"]["most_common_letters"] = (
             letter_counter.most_common(5)
         )
 
-    result["character_analysis"]["uppercase_count"] = sum(
-        1 for c in text if c.isupper()
-    )
-    result["character_analysis"]["lowercase_count"] = sum(
-        1 for c in text if c.islower()
-    )
-    result["character_analysis"]["digit_count"] = sum(
-        1 for c in text if c.isdigit()
-    )
-    result["character_analysis"]["punctuation_count"] = sum(
-        1 for c in text if c in ".,!?;:"
-    )
-    result["character_analysis"]["whitespace_count"] = sum(
-        1 for c in text if c.isspace()
-    )
+    result["character_analysis"].update(_count_character_classes(char_counts))
 
     if (
         result["basic_stats"]["total_sentences"] > 0
@@ -142,33 +221,8 @@ def analyze_text(text: str, options: Dict | None = None) -> Dict:
         and "include_language_detection" in options
         and options["include_language_detection"]
     ):
-        english_words = [
-            "the",
-            "and",
-            "to",
-            "of",
-            "a",
-            "in",
-            "is",
-            "it",
-            "you",
-            "that",
-        ]
-        spanish_words = [
-            "el",
-            "la",
-            "de",
-            "que",
-            "y",
-            "a",
-            "en",
-            "un",
-            "es",
-            "se",
-        ]
-
-        english_count = sum(1 for word in words if word in english_words)
-        spanish_count = sum(1 for word in words if word in spanish_words)
+        english_count = sum(1 for word in words if word in _ENGLISH_WORDS)
+        spanish_count = sum(1 for word in words if word in _SPANISH_WORDS)
 
         if english_count > spanish_count:
             result["language_detection"] = {
@@ -191,29 +245,8 @@ def analyze_text(text: str, options: Dict | None = None) -> Dict:
         and "include_sentiment" in options
         and options["include_sentiment"]
     ):
-        positive_words = [
-            "good",
-            "great",
-            "excellent",
-            "amazing",
-            "wonderful",
-            "fantastic",
-            "love",
-            "happy",
-        ]
-        negative_words = [
-            "bad",
-            "terrible",
-            "awful",
-            "hate",
-            "sad",
-            "angry",
-            "disappointed",
-            "horrible",
-        ]
-
-        positive_count = sum(1 for word in words if word in positive_words)
-        negative_count = sum(1 for word in words if word in negative_words)
+        positive_count = sum(1 for word in words if word in _POSITIVE_WORDS)
+        negative_count = sum(1 for word in words if word in _NEGATIVE_WORDS)
 
         if positive_count > negative_count:
             sentiment = "Positive"
@@ -240,30 +273,30 @@ def format_analysis_report(analysis_result: Dict) -> str:
     if "error" in analysis_result:
         return f"Error: {analysis_result['error']}"
 
-    report = []
-    report.append("=== TEXT ANALYSIS REPORT ===\n")
+    report = ["=== TEXT ANALYSIS REPORT ===\n"]
+    word_stats = analysis_result.get("word_analysis", {})
 
     if "basic_stats" in analysis_result:
-        report.append("📊 BASIC STATISTICS:")
         stats = analysis_result["basic_stats"]
-        report.append(
-            f"  • Total Characters: {stats.get('total_characters', 0)}"
-        )
-        report.append(
-            f"  • Characters (no spaces): {stats.get('total_characters_no_spaces', 0)}"
-        )
-        report.append(
-            f"  • Total Words: {analysis_result.get('word_analysis', {}).get('total_words', 0)}"
+        total_characters = stats.get("total_characters", 0)
+        no_spaces = stats.get("total_characters_no_spaces", 0)
+        total_words = word_stats.get("total_words", 0)
+        total_sentences = stats.get("total_sentences", 0)
+        total_paragraphs = stats.get("total_paragraphs", 0)
+        report.extend(
+            [
+                "📊 BASIC STATISTICS:",
+                f"  • Total Characters: {total_characters}",
+                f"  • Characters (no spaces): {no_spaces}",
+                f"  • Total Words: {total_words}",
+                f"  • Total Sentences: {total_sentences}",
+                f"  • Total Paragraphs: {total_paragraphs}",
+                "",
+            ]
         )
-        report.append(f"  • Total Sentences: {stats.get('total_sentences', 0)}")
-        report.append(
-            f"  • Total Paragraphs: {stats.get('total_paragraphs', 0)}"
-        )
-        report.append("")
 
     if "word_analysis" in analysis_result:
         report.append("📝 WORD ANALYSIS:")
-        word_stats = analysis_result["word_analysis"]
 
         if "average_word_length" in word_stats:
             report.append(
@@ -283,20 +316,22 @@ def format_analysis_report(analysis_result: Dict) -> str:
 
         if "most_common_words" in word_stats:
             report.append("  • Most Common Words:")
-            for word, count in word_stats["most_common_words"]:
-                report.append(f"    - '{word}': {count}")
+            report.extend(
+                f"    - '{word}': {count}"
+                for word, count in word_stats["most_common_words"]
+            )
 
         report.append("")
 
     if "character_analysis" in analysis_result:
         report.append("🔤 CHARACTER ANALYSIS:")
-        char_stats = analysis_result["character_analysis"]
 
-        for key, value in char_stats.items():
+        for key, value in analysis_result["character_analysis"].items():
             if key == "most_common_letters":
                 report.append("  • Most Common Letters:")
-                for letter, count in value:
-                    report.append(f"    - '{letter}': {count}")
+                report.extend(
+                    f"    - '{letter}': {count}" for letter, count in value
+                )
             else:
                 readable_key = key.replace("_", " ").title()
                 report.append(f"  • {readable_key}: {value}")
@@ -305,34 +340,34 @@ def format_analysis_report(analysis_result: Dict) -> str:
 
     if "readability" in analysis_result:
         report.append("📖 READABILITY:")
-        readability = analysis_result["readability"]
-
-        for key, value in readability.items():
-            readable_key = key.replace("_", " ").title()
-            report.append(f"  • {readable_key}: {value}")
-
+        report.extend(
+            f"  • {key.replace('_', ' ').title()}: {value}"
+            for key, value in analysis_result["readability"].items()
+        )
         report.append("")
 
     if "language_detection" in analysis_result:
-        report.append("🌐 LANGUAGE DETECTION:")
         lang_info = analysis_result["language_detection"]
-        report.append(
-            f"  • Detected Language: {lang_info['detected_language']}"
+        report.extend(
+            [
+                "🌐 LANGUAGE DETECTION:",
+                f"  • Detected Language: {lang_info['detected_language']}",
+                f"  • Confidence: {lang_info['confidence']}",
+                "",
+            ]
         )
-        report.append(f"  • Confidence: {lang_info['confidence']}")
-        report.append("")
 
     if "sentiment_analysis" in analysis_result:
-        report.append("😊 SENTIMENT ANALYSIS:")
         sentiment = analysis_result["sentiment_analysis"]
-        report.append(f"  • Overall Sentiment: {sentiment['sentiment']}")
-        report.append(
-            f"  • Positive Words: {sentiment['positive_words_count']}"
+        report.extend(
+            [
+                "😊 SENTIMENT ANALYSIS:",
+                f"  • Overall Sentiment: {sentiment['sentiment']}",
+                f"  • Positive Words: {sentiment['positive_words_count']}",
+                f"  • Negative Words: {sentiment['negative_words_count']}",
+                "",
+            ]
         )
-        report.append(
-            f"  • Negative Words: {sentiment['negative_words_count']}"
-        )
-        report.append("")
 
     return "\n".join(report)
 
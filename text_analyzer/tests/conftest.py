@@ -0,0 +1,39 @@
+"""
+Shared fixtures for text analyzer tests
+"""
+
+import json
+
+import pytest
+from text_analyzer.src.text_analyzer import analyze_text
+from text_analyzer.tests.golden import SIMPLE_GOLDEN_PATH, SIMPLE_TEXT
+
+
+@pytest.fixture(scope="session")
+def simple_text():
+    """Simple text fixture for testing"""
+    return SIMPLE_TEXT
+
+
+@pytest.fixture(scope="session")
+def simple_result(simple_text):
+    """Analysis of simple_text, computed once and shared across tests"""
+    return analyze_text(simple_text)
+
+
+@pytest.fixture(scope="session")
+def simple_golden():
+    """Expected analysis of simple_text, written by scripts/regen_golden.py"""
+    return json.loads(SIMPLE_GOLDEN_PATH.read_text(encoding="utf-8"))
+
+
+@pytest.fixture(scope="session")
+def complex_text():
+    """Complex text fixture for testing"""
+    return """
+        Python is a wonderful programming language. It's easy to learn and very powerful!
+        Many developers love Python because of its simplicity and readability.
+
+        You can build web applications, data analysis tools, and even machine learning models.
+        The community is amazing and very helpful.
+        """
@@ -0,0 +1,10 @@
+"""
+Golden-file inputs shared by the text analyzer tests and scripts/regen_golden.py
+"""
+
+from pathlib import Path
+
+SIMPLE_TEXT = "Hello world. This is a test."
+SIMPLE_GOLDEN_PATH = (
+    Path(__file__).parent / "fixtures" / "simple_text.golden.json"
+)